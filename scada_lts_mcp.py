@@ -9,12 +9,13 @@ Based on SCADA-LTS: https://github.com/SCADA-LTS/Scada-LTS
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import (
@@ -36,6 +37,22 @@ from mcp.types import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("scada-lts-mcp")
 
+# Maximum number of point value requests in flight at once
+POINT_VALUE_CONCURRENCY = 20
+
+# Seconds to wait before retrying the batch point value endpoint after it failed
+BATCH_REPROBE_INTERVAL = 300.0
+
+
+def _text_result(text: str) -> CallToolResult:
+    """Wrap text in a tool call result"""
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to compact JSON text"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class ScadaLTSClient:
     """Client for interacting with SCADA-LTS REST API"""
@@ -45,7 +62,39 @@ class ScadaLTSClient:
         self.username = username
         self.password = password
         self.session_token = None
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self._base_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        # request URL -> (fetch time, parsed data, rendered JSON text or None)
+        self._cache: Dict[str, Tuple[float, Any, Optional[str]]] = {}
+        self._cache_ttl = 10.0
+        self._ds_index: Dict[Any, Dict[str, Any]] = {}
+        self._ds_index_source: Optional[List[Dict[str, Any]]] = None
+        # Monotonic time before which the batch point value endpoint is not retried
+        self._batch_unsupported_until = 0.0
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
+        )
+
+    def reconfigure(self, base_url: str, username: str = "", password: str = ""):
+        """Point the client at a new server, keeping the HTTP connection pool"""
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+        self.session_token = None
+        self._base_headers.pop("Authorization", None)
+        self._invalidate_cache()
+        self._ds_index = {}
+        self._ds_index_source = None
+        self._batch_unsupported_until = 0.0
+
+    async def close(self):
+        """Close the underlying HTTP connection pool"""
+        await self.client.aclose()
 
     async def authenticate(self) -> bool:
         """Authenticate with SCADA-LTS system"""
@@ -53,6 +102,10 @@ class ScadaLTSClient:
             logger.warning("No credentials provided, using guest access")
             return True
 
+        # Drop any previous token before re-authenticating
+        self.session_token = None
+        self._base_headers.pop("Authorization", None)
+
         auth_url = f"{self.base_url}/api/auth/login"
         try:
             response = await self.client.post(
@@ -60,64 +113,199 @@ class ScadaLTSClient:
                 json={"username": self.username, "password": self.password}
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
+                if not isinstance(data, dict):
+                    logger.error("Authentication failed: unexpected response body")
+                    return False
                 self.session_token = data.get("token")
+                if self.session_token:
+                    self._base_headers["Authorization"] = f"Bearer {self.session_token}"
                 return True
             else:
-                logger.error(f"Authentication failed: {response.status_code}")
+                logger.error("Authentication failed: %s", response.status_code)
                 return False
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Authentication error: %s", e)
             return False
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        headers = {"Content-Type": "application/json"}
-        if self.session_token:
-            headers["Authorization"] = f"Bearer {self.session_token}"
-        return headers
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET a JSON resource, parsing the raw response bytes"""
+        response = await self.client.get(url, params=params, headers=self._base_headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a GET request"""
+        return str(httpx.URL(url, params=params)) if params else url
+
+    async def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                          ttl: Optional[float] = None) -> Any:
+        """GET a JSON resource, reusing a cached result younger than ttl seconds
+
+        Cache hits return the cached object itself rather than a copy, and the data
+        source index and rendered JSON text are keyed on that identity, so callers
+        must not mutate the result.
+        """
+        if ttl is None:
+            ttl = self._cache_ttl
+        cache_key = self._cache_key(url, params)
+        cached = self._cache.get(cache_key)
+        if cached:
+            if monotonic() - cached[0] < ttl:
+                return cached[1]
+            # Drop the stale entry so it does not pin the old payload
+            del self._cache[cache_key]
+
+        data = await self._get_json(url, params)
+        self._cache[cache_key] = (monotonic(), data, None)
+        return data
+
+    def _rendered(self, cache_key: str, data: Any) -> str:
+        """Render data as JSON text, memoizing the text on its cache entry"""
+        cached = self._cache.get(cache_key)
+        if cached is None or cached[1] is not data:
+            return _dumps(data)
+        if cached[2] is None:
+            cached = (cached[0], data, _dumps(data))
+            self._cache[cache_key] = cached
+        return cached[2]
+
+    def _invalidate_cache(self):
+        """Drop all cached GET results"""
+        self._cache.clear()
+
+    async def _fetch_data_sources(self) -> Tuple[List[Dict[str, Any]], str]:
+        """Get all data sources and their cache key"""
+        url = f"{self.base_url}/api/datasources"
+        try:
+            return await self._cached_get(url), url
+        except httpx.HTTPStatusError:
+            return [], url
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Error getting data sources: %s", e)
+            return [], url
 
     async def get_data_sources(self) -> List[Dict[str, Any]]:
         """Get all data sources"""
-        url = f"{self.base_url}/api/datasources"
+        data_sources, _ = await self._fetch_data_sources()
+        return data_sources
+
+    async def get_data_sources_rendered(self) -> Tuple[List[Dict[str, Any]], str]:
+        """Get all data sources together with their JSON text"""
+        data_sources, cache_key = await self._fetch_data_sources()
+        return data_sources, self._rendered(cache_key, data_sources)
+
+    async def get_data_source(self, data_source_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single data source by ID"""
+        data_sources = await self.get_data_sources()
+        # Rebuild the ID index only when a new list was fetched
+        if data_sources is not self._ds_index_source:
+            self._ds_index = {ds.get("id"): ds for ds in data_sources}
+            self._ds_index_source = data_sources
+        return self._ds_index.get(data_source_id)
+
+    async def _fetch_data_points(self, data_source_id: Optional[int] = None) -> Tuple[List[Dict[str, Any]], str]:
+        """Get data points, optionally filtered by data source ID, and their cache key"""
+        url = f"{self.base_url}/api/datapoints"
+        params = {"dataSourceId": data_source_id} if data_source_id else None
+        cache_key = self._cache_key(url, params)
+
         try:
-            response = await self.client.get(url, headers=self._get_headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
-        except Exception as e:
-            logger.error(f"Error getting data sources: {e}")
-            return []
+            return await self._cached_get(url, params), cache_key
+        except httpx.HTTPStatusError:
+            return [], cache_key
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Error getting data points: %s", e)
+            return [], cache_key
 
     async def get_data_points(self, data_source_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get data points, optionally filtered by data source ID"""
-        url = f"{self.base_url}/api/datapoints"
-        if data_source_id:
-            url += f"?dataSourceId={data_source_id}"
+        data_points, _ = await self._fetch_data_points(data_source_id)
+        return data_points
 
-        try:
-            response = await self.client.get(url, headers=self._get_headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
-        except Exception as e:
-            logger.error(f"Error getting data points: {e}")
-            return []
+    async def get_data_points_rendered(
+            self, data_source_id: Optional[int] = None) -> Tuple[List[Dict[str, Any]], str]:
+        """Get data points together with their JSON text"""
+        data_points, cache_key = await self._fetch_data_points(data_source_id)
+        return data_points, self._rendered(cache_key, data_points)
+
+    def _point_value_url(self, point_id: int) -> str:
+        """Build the URL of a data point's latest value"""
+        return f"{self.base_url}/api/point-values/{point_id}/latest"
 
     async def get_point_value(self, point_id: int) -> Optional[Dict[str, Any]]:
         """Get current value of a data point"""
-        url = f"{self.base_url}/api/point-values/{point_id}/latest"
         try:
-            response = await self.client.get(url, headers=self._get_headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return None
-        except Exception as e:
-            logger.error(f"Error getting point value: {e}")
+            return await self._get_json(self._point_value_url(point_id))
+        except httpx.HTTPStatusError:
+            return None
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Error getting point value: %s", e)
+            return None
+
+    async def get_point_value_raw(self, point_id: int) -> Optional[bytes]:
+        """Get current value of a data point as the unparsed JSON response body
+
+        Returns None unless the server answered with a non-empty application/json body.
+        """
+        try:
+            response = await self.client.get(self._point_value_url(point_id), headers=self._base_headers)
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            return None
+        except httpx.RequestError as e:
+            logger.error("Error getting point value: %s", e)
+            return None
+
+        content_type = response.headers.get("content-type", "")
+        if content_type.split(";", 1)[0].strip().lower() != "application/json":
+            logger.warning("Unexpected content type for point %s value: %s", point_id, content_type)
             return None
+        return response.content or None
+
+    async def get_point_values_raw(self, point_ids: List[int]) -> Dict[int, Optional[bytes]]:
+        """Get current values of several data points as JSON bytes, batched when the server supports it"""
+        if not point_ids:
+            return {}
+
+        if monotonic() >= self._batch_unsupported_until:
+            url = f"{self.base_url}/api/point-values/batch"
+            values = None
+            try:
+                response = await self.client.post(
+                    url,
+                    content=orjson.dumps({"ids": point_ids}),
+                    headers=self._base_headers
+                )
+                if response.status_code == 200:
+                    values = orjson.loads(response.content)
+            except (httpx.RequestError, orjson.JSONDecodeError) as e:
+                logger.error("Error getting point values: %s", e)
+
+            # Only a {"<id>": value} object covering some requested point is usable
+            if isinstance(values, dict) and any(str(point_id) in values for point_id in point_ids):
+                return {
+                    point_id: orjson.dumps(values[str(point_id)]) if str(point_id) in values else None
+                    for point_id in point_ids
+                }
+            logger.info("Batch point value endpoint unavailable, falling back to per-point requests")
+            self._batch_unsupported_until = monotonic() + BATCH_REPROBE_INTERVAL
+
+        semaphore = asyncio.Semaphore(POINT_VALUE_CONCURRENCY)
+
+        async def fetch_value(point_id: int) -> Optional[bytes]:
+            async with semaphore:
+                return await self.get_point_value_raw(point_id)
+
+        values = await asyncio.gather(
+            *(fetch_value(point_id) for point_id in point_ids),
+            return_exceptions=True
+        )
+        return {
+            point_id: value if isinstance(value, bytes) else None
+            for point_id, value in zip(point_ids, values)
+        }
 
     async def set_point_value(self, point_id: int, value: Any) -> bool:
         """Set value of a settable data point"""
@@ -126,51 +314,62 @@ class ScadaLTSClient:
             response = await self.client.post(
                 url,
                 json={"value": value},
-                headers=self._get_headers()
+                headers=self._base_headers
             )
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Error setting point value: {e}")
+            if response.status_code == 200:
+                self._invalidate_cache()
+                return True
+            return False
+        except httpx.RequestError as e:
+            logger.error("Error setting point value: %s", e)
             return False
 
     async def get_alarms(self, active_only: bool = True) -> List[Dict[str, Any]]:
         """Get system alarms"""
         url = f"{self.base_url}/api/alarms"
-        if active_only:
-            url += "?active=true"
+        params = {"active": "true"} if active_only else None
 
         try:
-            response = await self.client.get(url, headers=self._get_headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return []
-        except Exception as e:
-            logger.error(f"Error getting alarms: {e}")
+            return await self._get_json(url, params)
+        except httpx.HTTPStatusError:
+            return []
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Error getting alarms: %s", e)
             return []
 
     async def acknowledge_alarm(self, alarm_id: int) -> bool:
         """Acknowledge an alarm"""
         url = f"{self.base_url}/api/alarms/{alarm_id}/ack"
         try:
-            response = await self.client.post(url, headers=self._get_headers())
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Error acknowledging alarm: {e}")
+            response = await self.client.post(url, headers=self._base_headers)
+            if response.status_code == 200:
+                self._invalidate_cache()
+                return True
+            return False
+        except httpx.RequestError as e:
+            logger.error("Error acknowledging alarm: %s", e)
             return False
 
-    async def get_system_status(self) -> Dict[str, Any]:
-        """Get system status information"""
+    async def _fetch_system_status(self) -> Tuple[Dict[str, Any], str]:
+        """Get system status information and its cache key"""
         url = f"{self.base_url}/api/system/status"
         try:
-            response = await self.client.get(url, headers=self._get_headers())
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"status": "unknown", "error": f"HTTP {response.status_code}"}
-        except Exception as e:
-            logger.error(f"Error getting system status: {e}")
-            return {"status": "error", "error": str(e)}
+            return await self._cached_get(url), url
+        except httpx.HTTPStatusError as e:
+            return {"status": "unknown", "error": f"HTTP {e.response.status_code}"}, url
+        except (httpx.RequestError, orjson.JSONDecodeError) as e:
+            logger.error("Error getting system status: %s", e)
+            return {"status": "error", "error": str(e)}, url
+
+    async def get_system_status(self) -> Dict[str, Any]:
+        """Get system status information"""
+        status, _ = await self._fetch_system_status()
+        return status
+
+    async def get_system_status_rendered(self) -> Tuple[Dict[str, Any], str]:
+        """Get system status information together with its JSON text"""
+        status, cache_key = await self._fetch_system_status()
+        return status, self._rendered(cache_key, status)
 
 
 # Global SCADA-LTS client instance
@@ -180,318 +379,272 @@ scada_client: Optional[ScadaLTSClient] = None
 server = Server("scada-lts-mcp")
 
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available SCADA-LTS tools"""
-    return [
-        Tool(
-            name="get_data_sources",
-            description="Get all data sources from SCADA-LTS system",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_data_points",
-            description="Get data points from SCADA-LTS system, optionally filtered by data source ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data_source_id": {
-                        "type": "integer",
-                        "description": "Optional data source ID to filter data points"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_point_value",
-            description="Get current value of a specific data point",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "point_id": {
-                        "type": "integer",
-                        "description": "ID of the data point to read"
-                    }
-                },
-                "required": ["point_id"]
-            }
-        ),
-        Tool(
-            name="set_point_value",
-            description="Set value of a settable data point",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "point_id": {
-                        "type": "integer",
-                        "description": "ID of the data point to write to"
-                    },
-                    "value": {
-                        "description": "Value to write (number, boolean, or string)"
-                    }
+# Tool listing is static, so build it once at import time
+_TOOLS: List[Tool] = [
+    Tool(
+        name="get_data_sources",
+        description="Get all data sources from SCADA-LTS system",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_data_points",
+        description="Get data points from SCADA-LTS system, optionally filtered by data source ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data_source_id": {
+                    "type": "integer",
+                    "description": "Optional data source ID to filter data points"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_point_value",
+        description="Get current value of a specific data point",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "point_id": {
+                    "type": "integer",
+                    "description": "ID of the data point to read"
+                }
+            },
+            "required": ["point_id"]
+        }
+    ),
+    Tool(
+        name="set_point_value",
+        description="Set value of a settable data point",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "point_id": {
+                    "type": "integer",
+                    "description": "ID of the data point to write to"
                 },
-                "required": ["point_id", "value"]
-            }
-        ),
-        Tool(
-            name="get_alarms",
-            description="Get system alarms",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "active_only": {
-                        "type": "boolean",
-                        "description": "Whether to return only active alarms (default: true)",
-                        "default": True
-                    }
+                "value": {
+                    "description": "Value to write (number, boolean, or string)"
+                }
+            },
+            "required": ["point_id", "value"]
+        }
+    ),
+    Tool(
+        name="get_alarms",
+        description="Get system alarms",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "active_only": {
+                    "type": "boolean",
+                    "description": "Whether to return only active alarms (default: true)",
+                    "default": True
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="acknowledge_alarm",
+        description="Acknowledge an alarm",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "alarm_id": {
+                    "type": "integer",
+                    "description": "ID of the alarm to acknowledge"
+                }
+            },
+            "required": ["alarm_id"]
+        }
+    ),
+    Tool(
+        name="get_system_status",
+        description="Get SCADA-LTS system status information",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="configure_connection",
+        description="Configure connection to SCADA-LTS system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "base_url": {
+                    "type": "string",
+                    "description": "Base URL of SCADA-LTS system (e.g., http://localhost:8080/Scada-LTS)"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="acknowledge_alarm",
-            description="Acknowledge an alarm",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "alarm_id": {
-                        "type": "integer",
-                        "description": "ID of the alarm to acknowledge"
-                    }
+                "username": {
+                    "type": "string",
+                    "description": "Username for authentication (optional)"
                 },
-                "required": ["alarm_id"]
-            }
-        ),
-        Tool(
-            name="get_system_status",
-            description="Get SCADA-LTS system status information",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="configure_connection",
-            description="Configure connection to SCADA-LTS system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base_url": {
-                        "type": "string",
-                        "description": "Base URL of SCADA-LTS system (e.g., http://localhost:8080/Scada-LTS)"
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": "Username for authentication (optional)"
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "Password for authentication (optional)"
-                    }
-                },
-                "required": ["base_url"]
-            }
-        )
-    ]
+                "password": {
+                    "type": "string",
+                    "description": "Password for authentication (optional)"
+                }
+            },
+            "required": ["base_url"]
+        }
+    )
+]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
-    """Handle tool calls"""
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available SCADA-LTS tools"""
+    return _TOOLS
+
+
+async def _handle_configure_connection(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the configure_connection tool"""
     global scada_client
 
-    try:
-        if name == "configure_connection":
-            base_url = arguments["base_url"]
-            username = arguments.get("username", "")
-            password = arguments.get("password", "")
-
-            scada_client = ScadaLTSClient(base_url, username, password)
-
-            # Test authentication
-            auth_success = await scada_client.authenticate()
-
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Connection configured for {base_url}. "
-                             f"Authentication: {'successful' if auth_success else 'failed or guest mode'}"
-                    )
-                ]
-            )
+    base_url = arguments["base_url"]
+    username = arguments.get("username", "")
+    password = arguments.get("password", "")
 
-        # Check if client is configured
-        if not scada_client:
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text="SCADA-LTS client not configured. Please use configure_connection tool first."
-                    )
-                ]
-            )
+    # Reuse the existing client so its connection pool is kept
+    if scada_client is None:
+        scada_client = ScadaLTSClient(base_url, username, password)
+    else:
+        scada_client.reconfigure(base_url, username, password)
 
-        if name == "get_data_sources":
-            data_sources = await scada_client.get_data_sources()
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(data_sources)} data sources:\n" +
-                             json.dumps(data_sources, indent=2)
-                    )
-                ]
-            )
+    # Test authentication
+    auth_success = await scada_client.authenticate()
 
-        elif name == "get_data_points":
-            data_source_id = arguments.get("data_source_id")
-            data_points = await scada_client.get_data_points(data_source_id)
-            filter_text = f" for data source {data_source_id}" if data_source_id else ""
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(data_points)} data points{filter_text}:\n" +
-                             json.dumps(data_points, indent=2)
-                    )
-                ]
-            )
+    return _text_result(f"Connection configured for {base_url}. "
+                        f"Authentication: {'successful' if auth_success else 'failed or guest mode'}")
 
-        elif name == "get_point_value":
-            point_id = arguments["point_id"]
-            value = await scada_client.get_point_value(point_id)
-            if value is not None:
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"Point {point_id} value:\n" +
-                            json.dumps(value, indent=2)
-                        )
-                    ]
-                )
-            else:
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"Could not retrieve value for point {point_id}"
-                        )
-                    ]
-                )
 
-        elif name == "set_point_value":
-            point_id = arguments["point_id"]
-            value = arguments["value"]
-            success = await scada_client.set_point_value(point_id, value)
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Setting point {point_id} to {value}: {'successful' if success else 'failed'}"
-                    )
-                ]
-            )
+async def _handle_get_data_sources(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the get_data_sources tool"""
+    data_sources, rendered = await scada_client.get_data_sources_rendered()
+    return _text_result(f"Found {len(data_sources)} data sources:\n" + rendered)
 
-        elif name == "get_alarms":
-            active_only = arguments.get("active_only", True)
-            alarms = await scada_client.get_alarms(active_only)
-            alarm_type = "active" if active_only else "all"
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Found {len(alarms)} {alarm_type} alarms:\n" +
-                             json.dumps(alarms, indent=2)
-                    )
-                ]
-            )
 
-        elif name == "acknowledge_alarm":
-            alarm_id = arguments["alarm_id"]
-            success = await scada_client.acknowledge_alarm(alarm_id)
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Acknowledging alarm {alarm_id}: {'successful' if success else 'failed'}"
-                    )
-                ]
-            )
+async def _handle_get_data_points(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the get_data_points tool"""
+    data_source_id = arguments.get("data_source_id")
+    data_points, rendered = await scada_client.get_data_points_rendered(data_source_id)
+    filter_text = f" for data source {data_source_id}" if data_source_id else ""
+    return _text_result(f"Found {len(data_points)} data points{filter_text}:\n" + rendered)
 
-        elif name == "get_system_status":
-            status = await scada_client.get_system_status()
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"System status:\n" + json.dumps(status, indent=2)
-                    )
-                ]
-            )
 
-        else:
-            return CallToolResult(
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Unknown tool: {name}"
-                    )
-                ]
-            )
+async def _handle_get_point_value(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the get_point_value tool"""
+    point_id = arguments["point_id"]
+    value = await scada_client.get_point_value_raw(point_id)
+    if value is not None:
+        return _text_result(f"Point {point_id} value:\n" +
+                            value.decode(errors="replace"))
+    else:
+        return _text_result(f"Could not retrieve value for point {point_id}")
+
+
+async def _handle_set_point_value(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the set_point_value tool"""
+    point_id = arguments["point_id"]
+    value = arguments["value"]
+    success = await scada_client.set_point_value(point_id, value)
+    return _text_result(f"Setting point {point_id} to {value}: {'successful' if success else 'failed'}")
+
+
+async def _handle_get_alarms(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the get_alarms tool"""
+    active_only = arguments.get("active_only", True)
+    alarms = await scada_client.get_alarms(active_only)
+    alarm_type = "active" if active_only else "all"
+    return _text_result(f"Found {len(alarms)} {alarm_type} alarms:\n" +
+                        _dumps(alarms))
+
+
+async def _handle_acknowledge_alarm(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the acknowledge_alarm tool"""
+    alarm_id = arguments["alarm_id"]
+    success = await scada_client.acknowledge_alarm(alarm_id)
+    return _text_result(f"Acknowledging alarm {alarm_id}: {'successful' if success else 'failed'}")
+
+
+async def _handle_get_system_status(arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle the get_system_status tool"""
+    _, rendered = await scada_client.get_system_status_rendered()
+    return _text_result(f"System status:\n" + rendered)
+
+
+# Tool name -> handler
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[CallToolResult]]] = {
+    "configure_connection": _handle_configure_connection,
+    "get_data_sources": _handle_get_data_sources,
+    "get_data_points": _handle_get_data_points,
+    "get_point_value": _handle_get_point_value,
+    "set_point_value": _handle_set_point_value,
+    "get_alarms": _handle_get_alarms,
+    "acknowledge_alarm": _handle_acknowledge_alarm,
+    "get_system_status": _handle_get_system_status,
+}
 
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+    """Handle tool calls"""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _text_result(f"Unknown tool: {name}")
+
+    # Check if client is configured
+    if not scada_client and handler is not _handle_configure_connection:
+        return _text_result("SCADA-LTS client not configured. Please use configure_connection tool first.")
+
+    try:
+        return await handler(arguments)
     except Exception as e:
-        return CallToolResult(
-            content=[
-                TextContent(
-                    type="text",
-                    text=f"Error executing {name}: {str(e)}"
-                )
-            ]
-        )
+        return _text_result(f"Error executing {name}: {str(e)}")
+
+
+# Prompt listing is static, so build it once at import time
+_PROMPTS: List[Prompt] = [
+    Prompt(
+        name="scada_system_overview",
+        description="Get a comprehensive overview of the SCADA-LTS system",
+        arguments=[
+            PromptArgument(
+                name="include_alarms",
+                description="Whether to include alarm information",
+                required=False
+            )
+        ]
+    ),
+    Prompt(
+        name="data_point_analysis",
+        description="Analyze data points for a specific data source",
+        arguments=[
+            PromptArgument(
+                name="data_source_id",
+                description="ID of the data source to analyze",
+                required=True
+            )
+        ]
+    )
+]
 
 
 @server.list_prompts()
 async def list_prompts() -> List[Prompt]:
     """List available prompts"""
-    return [
-        Prompt(
-            name="scada_system_overview",
-            description="Get a comprehensive overview of the SCADA-LTS system",
-            arguments=[
-                PromptArgument(
-                    name="include_alarms",
-                    description="Whether to include alarm information",
-                    required=False
-                )
-            ]
-        ),
-        Prompt(
-            name="data_point_analysis",
-            description="Analyze data points for a specific data source",
-            arguments=[
-                PromptArgument(
-                    name="data_source_id",
-                    description="ID of the data source to analyze",
-                    required=True
-                )
-            ]
-        )
-    ]
+    return _PROMPTS
 
 
-@server.get_prompt()
-async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
-    """Handle prompt requests"""
-    global scada_client
-
+async def _build_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
+    """Build the requested prompt from live SCADA-LTS data"""
     if not scada_client:
         return GetPromptResult(
             description="SCADA-LTS client not configured",
@@ -506,28 +659,32 @@ async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
         include_alarms = arguments.get(
             "include_alarms", "false").lower() == "true"
 
-        # Gather system information
-        data_sources = await scada_client.get_data_sources()
-        data_points = await scada_client.get_data_points()
-        system_status = await scada_client.get_system_status()
+        # Gather system information concurrently
+        ((data_sources, data_sources_text), (data_points, data_points_text),
+         (_, system_status_text), *maybe_alarms) = await asyncio.gather(
+            scada_client.get_data_sources_rendered(),
+            scada_client.get_data_points_rendered(),
+            scada_client.get_system_status_rendered(),
+            *([scada_client.get_alarms()] if include_alarms else [])
+        )
 
         content = f"""# SCADA-LTS System Overview
 
 ## System Status
-{json.dumps(system_status, indent=2)}
+{system_status_text}
 
 ## Data Sources ({len(data_sources)} total)
-{json.dumps(data_sources, indent=2)}
+{data_sources_text}
 
 ## Data Points ({len(data_points)} total)
-{json.dumps(data_points, indent=2)}
+{data_points_text}
 """
 
         if include_alarms:
-            alarms = await scada_client.get_alarms()
+            alarms = maybe_alarms[0]
             content += f"""
 ## Active Alarms ({len(alarms)} total)
-{json.dumps(alarms, indent=2)}
+{_dumps(alarms)}
 """
 
         return GetPromptResult(
@@ -541,9 +698,7 @@ async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
         data_source_id = int(arguments["data_source_id"])
 
         # Get data source information
-        data_sources = await scada_client.get_data_sources()
-        target_ds = next(
-            (ds for ds in data_sources if ds.get("id") == data_source_id), None)
+        target_ds = await scada_client.get_data_source(data_source_id)
 
         if not target_ds:
             return GetPromptResult(
@@ -558,23 +713,24 @@ async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
         data_points = await scada_client.get_data_points(data_source_id)
 
         # Get current values for data points
-        point_values = {}
-        for dp in data_points:
-            point_id = dp.get("id")
-            if point_id:
-                value = await scada_client.get_point_value(point_id)
-                point_values[point_id] = value
+        point_ids = [dp["id"] for dp in data_points if dp.get("id")]
+        raw_values = await scada_client.get_point_values_raw(point_ids)
+        # Splice the JSON bodies into the output without parsing them
+        point_values = {
+            point_id: orjson.Fragment(raw) if raw is not None else None
+            for point_id, raw in raw_values.items()
+        }
 
         content = f"""# Data Source Analysis: {target_ds.get('name', 'Unknown')}
 
 ## Data Source Details
-{json.dumps(target_ds, indent=2)}
+{_dumps(target_ds)}
 
 ## Data Points ({len(data_points)} total)
-{json.dumps(data_points, indent=2)}
+{_dumps(data_points)}
 
 ## Current Values
-{json.dumps(point_values, indent=2)}
+{_dumps(point_values)}
 """
 
         return GetPromptResult(
@@ -593,24 +749,52 @@ async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
         )
 
 
+@server.get_prompt()
+async def get_prompt(name: str, arguments: Dict[str, str]) -> GetPromptResult:
+    """Handle prompt requests"""
+    try:
+        return await _build_prompt(name, arguments)
+    except Exception as e:
+        return GetPromptResult(
+            description="Error building prompt",
+            messages=[
+                UserMessage(content=f"Error executing prompt {name}: {str(e)}")
+            ]
+        )
+
+
 async def main():
     """Main entry point"""
     # Import here to avoid issues if mcp package is not available
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="scada-lts-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=None,
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="scada-lts-mcp",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=None,
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        if scada_client:
+            await scada_client.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use the faster libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    # uvloop.run() only exists in uvloop 0.18 and later
+    run = getattr(uvloop, "run", None)
+    if uvloop is not None and run is None:
+        logger.warning("uvloop is too old (needs 0.18+), using the default event loop")
+    (run or asyncio.run)(main())